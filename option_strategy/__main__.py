@@ -21,54 +21,53 @@ STRATEGIES = {
 
 def build_strategy(args) -> strat.Strategy:
     """Build a strategy from CLI arguments using Black-Scholes pricing."""
-    bs_models = []
-    for strike in args.strikes:
-        bs_models.append(BlackScholes(
-            spot=args.spot,
-            strike=strike,
-            expiry_days=args.expiry,
-            volatility=args.volatility,
-            rate=args.rate,
-        ))
+    calls, puts, _, _ = BlackScholes.vectorized(
+        spot=args.spot,
+        strikes=args.strikes,
+        expiry_days=args.expiry,
+        volatility=args.volatility,
+        rate=args.rate,
+    )
+    calls, puts = calls.tolist(), puts.tolist()
 
     name = args.strategy
     strikes = args.strikes
 
     if name == "long_call":
-        premium = bs_models[0].call_price()
+        premium = calls[0]
         return strat.long_call(args.spot, strikes[0], premium)
 
     elif name == "long_put":
-        premium = bs_models[0].put_price()
+        premium = puts[0]
         return strat.long_put(args.spot, strikes[0], premium)
 
     elif name == "bull_call_spread":
         if len(strikes) < 2:
             print("Error: bull_call_spread requires 2 strikes", file=sys.stderr)
             sys.exit(1)
-        p1 = bs_models[0].call_price()
-        p2 = bs_models[1].call_price()
+        p1 = calls[0]
+        p2 = calls[1]
         return strat.bull_call_spread(args.spot, strikes[0], strikes[1], p1, p2)
 
     elif name == "bear_put_spread":
         if len(strikes) < 2:
             print("Error: bear_put_spread requires 2 strikes", file=sys.stderr)
             sys.exit(1)
-        p1 = bs_models[0].put_price()
-        p2 = bs_models[1].put_price()
+        p1 = puts[0]
+        p2 = puts[1]
         return strat.bear_put_spread(args.spot, strikes[0], strikes[1], p1, p2)
 
     elif name == "straddle":
-        call_prem = bs_models[0].call_price()
-        put_prem = bs_models[0].put_price()
+        call_prem = calls[0]
+        put_prem = puts[0]
         return strat.straddle(args.spot, strikes[0], call_prem, put_prem)
 
     elif name == "strangle":
         if len(strikes) < 2:
             print("Error: strangle requires 2 strikes", file=sys.stderr)
             sys.exit(1)
-        call_prem = bs_models[1].call_price()
-        put_prem = bs_models[0].put_price()
+        call_prem = calls[1]
+        put_prem = puts[0]
         return strat.strangle(args.spot, strikes[1], strikes[0], call_prem, put_prem)
 
     elif name == "iron_condor":
@@ -77,10 +76,10 @@ def build_strategy(args) -> strat.Strategy:
                   "(put_lower put_upper call_lower call_upper)", file=sys.stderr)
             sys.exit(1)
         prems = [
-            bs_models[0].put_price(),
-            bs_models[1].put_price(),
-            bs_models[2].call_price(),
-            bs_models[3].call_price(),
+            puts[0],
+            puts[1],
+            calls[2],
+            calls[3],
         ]
         return strat.iron_condor(
             args.spot,
@@ -92,7 +91,7 @@ def build_strategy(args) -> strat.Strategy:
         if len(strikes) < 3:
             print("Error: butterfly requires 3 strikes", file=sys.stderr)
             sys.exit(1)
-        prems = [bs.call_price() for bs in bs_models[:3]]
+        prems = calls[:3]
         return strat.butterfly_spread(
             args.spot, strikes[0], strikes[1], strikes[2],
             prems[0], prems[1], prems[2],
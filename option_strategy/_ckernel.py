@@ -0,0 +1,51 @@
+"""ctypes binding for the C P&L kernel built by ``_kernels_build``.
+
+Importing raises ImportError when the library has not been built, so
+callers can fall back to the Numba or NumPy kernels.
+"""
+
+import ctypes
+import os
+import sys
+
+import numpy as np
+
+# Must match _kernels_build.LIBRARY. Not imported from there, so that
+# running the build module does not find it already imported.
+LIBRARY = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "_kernels.dll" if sys.platform == "win32"
+                       else "_kernels.so")
+
+try:
+    _lib = ctypes.CDLL(LIBRARY)
+except OSError as e:
+    raise ImportError(f"C P&L kernel is not built: {e}") from None
+
+_c_pnl = _lib.pnl_kernel
+_c_pnl.restype = None
+_c_pnl.argtypes = [
+    ctypes.c_void_p, ctypes.c_int64,
+    ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+    ctypes.c_int64, ctypes.c_void_p, ctypes.c_void_p,
+]
+
+
+def pnl_kernel(spots, strikes, premiums, dir_qty, call_sign, out):
+    """Write total P&L at each spot into ``out`` and return ``(max, min)``.
+
+    Same contract as ``strategy._pnl_kernel``. ``out`` must be a
+    C-contiguous float64 array, since the C code writes to it directly.
+    """
+    if (out.dtype != np.float64 or not out.flags.c_contiguous
+            or out.shape != (len(spots),)):
+        raise ValueError("out must be a C-contiguous float64 array "
+                         "with one entry per spot")
+    spots, strikes, premiums, dir_qty, call_sign = (
+        np.ascontiguousarray(a, dtype=np.float64)
+        for a in (spots, strikes, premiums, dir_qty, call_sign))
+    minmax = (ctypes.c_double * 2)()
+    _c_pnl(spots.ctypes.data, spots.shape[0],
+           strikes.ctypes.data, premiums.ctypes.data,
+           dir_qty.ctypes.data, call_sign.ctypes.data,
+           strikes.shape[0], out.ctypes.data, minmax)
+    return minmax[0], minmax[1]
@@ -0,0 +1,129 @@
+/* P&L-at-expiry kernel for option_strategy.strategy.
+ *
+ * Same contract as _pnl_kernel in strategy.py: writes the total P&L at
+ * each spot into out and stores its max and min in minmax[0] and
+ * minmax[1]. On x86 an AVX2/FMA version processing sixteen spots at a
+ * time is selected at runtime, so the library still runs on older CPUs.
+ *
+ * Build with ``python -m option_strategy._kernels_build``.
+ */
+#include <math.h>
+#include <stdint.h>
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#include <immintrin.h>
+#define HAVE_AVX2_KERNEL 1
+#endif
+
+/* Spots [start, n) one at a time; also the tail of the AVX2 path. */
+static void pnl_scalar(const double *spots, int64_t start, int64_t n,
+                       const double *strikes, const double *premiums,
+                       const double *dir_qty, const double *call_sign,
+                       int64_t n_legs, double *out, double *mx, double *mn)
+{
+    for (int64_t j = start; j < n; j++) {
+        double s = spots[j];
+        double acc = 0.0;
+        for (int64_t i = 0; i < n_legs; i++) {
+            double d = call_sign[i] * (s - strikes[i]);
+            double intrinsic = d > 0.0 ? d : 0.0;
+            acc += (intrinsic - premiums[i]) * dir_qty[i];
+        }
+        out[j] = acc;
+        if (acc > *mx)
+            *mx = acc;
+        if (acc < *mn)
+            *mn = acc;
+    }
+}
+
+#ifdef HAVE_AVX2_KERNEL
+/* P&L contribution of one leg, broadcast as k/p/q/c, at four spots. */
+#define LEG_TERM(s, k, p, q, c, acc)                                        \
+    _mm256_fmadd_pd(                                                        \
+        _mm256_sub_pd(_mm256_max_pd(_mm256_mul_pd(c, _mm256_sub_pd(s, k)),  \
+                                    _mm256_setzero_pd()),                   \
+                      p),                                                   \
+        q, acc)
+
+/* Spots in blocks of sixteen, then four; returns how many were done. */
+__attribute__((target("avx2,fma")))
+static int64_t pnl_avx2(const double *spots, int64_t n,
+                        const double *strikes, const double *premiums,
+                        const double *dir_qty, const double *call_sign,
+                        int64_t n_legs, double *out, double *mx, double *mn)
+{
+    __m256d vmx = _mm256_set1_pd(*mx);
+    __m256d vmn = _mm256_set1_pd(*mn);
+    int64_t j = 0;
+    /* Sixteen spots per iteration in four independent accumulators, so
+       the FMA latency of one chain overlaps the others and each leg's
+       broadcasts are shared by all four. */
+    for (; j + 16 <= n; j += 16) {
+        __m256d s0 = _mm256_loadu_pd(spots + j);
+        __m256d s1 = _mm256_loadu_pd(spots + j + 4);
+        __m256d s2 = _mm256_loadu_pd(spots + j + 8);
+        __m256d s3 = _mm256_loadu_pd(spots + j + 12);
+        __m256d acc0 = _mm256_setzero_pd(), acc1 = _mm256_setzero_pd();
+        __m256d acc2 = _mm256_setzero_pd(), acc3 = _mm256_setzero_pd();
+        for (int64_t i = 0; i < n_legs; i++) {
+            __m256d k = _mm256_set1_pd(strikes[i]);
+            __m256d p = _mm256_set1_pd(premiums[i]);
+            __m256d q = _mm256_set1_pd(dir_qty[i]);
+            __m256d c = _mm256_set1_pd(call_sign[i]);
+            acc0 = LEG_TERM(s0, k, p, q, c, acc0);
+            acc1 = LEG_TERM(s1, k, p, q, c, acc1);
+            acc2 = LEG_TERM(s2, k, p, q, c, acc2);
+            acc3 = LEG_TERM(s3, k, p, q, c, acc3);
+        }
+        _mm256_storeu_pd(out + j, acc0);
+        _mm256_storeu_pd(out + j + 4, acc1);
+        _mm256_storeu_pd(out + j + 8, acc2);
+        _mm256_storeu_pd(out + j + 12, acc3);
+        vmx = _mm256_max_pd(vmx, _mm256_max_pd(_mm256_max_pd(acc0, acc1),
+                                               _mm256_max_pd(acc2, acc3)));
+        vmn = _mm256_min_pd(vmn, _mm256_min_pd(_mm256_min_pd(acc0, acc1),
+                                               _mm256_min_pd(acc2, acc3)));
+    }
+    for (; j + 4 <= n; j += 4) {
+        __m256d s = _mm256_loadu_pd(spots + j);
+        __m256d acc = _mm256_setzero_pd();
+        for (int64_t i = 0; i < n_legs; i++)
+            acc = LEG_TERM(s, _mm256_set1_pd(strikes[i]),
+                           _mm256_set1_pd(premiums[i]),
+                           _mm256_set1_pd(dir_qty[i]),
+                           _mm256_set1_pd(call_sign[i]), acc);
+        _mm256_storeu_pd(out + j, acc);
+        vmx = _mm256_max_pd(vmx, acc);
+        vmn = _mm256_min_pd(vmn, acc);
+    }
+    double lanes_mx[4], lanes_mn[4];
+    _mm256_storeu_pd(lanes_mx, vmx);
+    _mm256_storeu_pd(lanes_mn, vmn);
+    for (int k = 0; k < 4; k++) {
+        if (lanes_mx[k] > *mx)
+            *mx = lanes_mx[k];
+        if (lanes_mn[k] < *mn)
+            *mn = lanes_mn[k];
+    }
+    return j;
+}
+#endif
+
+void pnl_kernel(const double *spots, int64_t n, const double *strikes,
+                const double *premiums, const double *dir_qty,
+                const double *call_sign, int64_t n_legs, double *out,
+                double *minmax)
+{
+    double mx = -INFINITY, mn = INFINITY;
+    int64_t done = 0;
+#ifdef HAVE_AVX2_KERNEL
+    if (__builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma"))
+        done = pnl_avx2(spots, n, strikes, premiums, dir_qty, call_sign,
+                        n_legs, out, &mx, &mn);
+#endif
+    pnl_scalar(spots, done, n, strikes, premiums, dir_qty, call_sign,
+               n_legs, out, &mx, &mn);
+    minmax[0] = mx;
+    minmax[1] = mn;
+}
@@ -0,0 +1,32 @@
+"""Build the C P&L kernel as a shared library.
+
+Run ``python -m option_strategy._kernels_build`` (with a C compiler
+installed; ``CC`` overrides the default ``cc``) to build ``_kernels.c``
+next to this file. ``strategy.py`` loads the library through ctypes when
+present and otherwise uses the Numba or NumPy kernels.
+"""
+
+import os
+import subprocess
+import sys
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(_DIR, "_kernels.c")
+LIBRARY = os.path.join(_DIR, "_kernels.dll" if sys.platform == "win32"
+                       else "_kernels.so")
+
+
+def build() -> None:
+    """Compile SOURCE into LIBRARY.
+
+    AVX2 is enabled per function in the source and chosen at runtime, so
+    no -march flags are needed and the library runs on any x86-64 CPU.
+    """
+    compiler = os.environ.get("CC", "cc")
+    subprocess.run(
+        [compiler, "-O3", "-shared", "-fPIC", "-o", LIBRARY, SOURCE],
+        check=True)
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,25 @@
+"""Ahead-of-time build of the P&L kernel.
+
+Compiling here removes Numba's first-call JIT latency and the need for
+Numba at runtime. Run ``python -m option_strategy._strategy_aot`` (with
+Numba installed) to build the ``strategy_kernels`` extension next to this
+file; ``strategy.py`` picks it up automatically when present.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from option_strategy.strategy import _pnl_kernel
+
+cc = CC("strategy_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# The pure-Python kernel; prange compiles as a plain range loop here.
+cc.export("pnl_kernel",
+          "UniTuple(f8, 2)(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1])")(
+    getattr(_pnl_kernel, "py_func", _pnl_kernel))
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,12 +1,135 @@
 """Black-Scholes option pricing model with Greeks."""
 
 import math
-from scipy.stats import norm
+from enum import IntEnum
+
+import numpy as np
+from scipy.special import ndtr
+
+try:
+    import numba
+except ImportError:  # numba is optional; batch pricing falls back to Python
+    numba = None
+
+_NORM_PDF_C = 1.0 / math.sqrt(2.0 * math.pi)
+_SQRT1_2 = 1.0 / math.sqrt(2.0)
+
+# Column order of the arrays returned by BlackScholes.batch().
+BATCH_FIELDS = (
+    "call", "put", "call_delta", "put_delta", "gamma", "vega",
+    "call_theta", "put_theta", "call_rho", "put_rho",
+)
+
+
+class OptType(IntEnum):
+    """Option type, valued as the sign used in the pricing formulas."""
+    CALL = 1
+    PUT = -1
+
+
+_SIGNS = {"call": OptType.CALL, "put": OptType.PUT}
+
+
+def _as_sign(option_type) -> OptType:
+    """Convert 'call'/'put' or an OptType to an OptType.
+
+    Plain ints, floats and bools are rejected even though OptType members
+    compare equal to +1/-1.
+    """
+    if isinstance(option_type, OptType):
+        return option_type
+    if isinstance(option_type, str) and option_type in _SIGNS:
+        return _SIGNS[option_type]
+    raise ValueError(
+        f"option_type must be 'call' or 'put', got '{option_type}'")
+
+
+def _cdf_pair(x: float) -> tuple[float, float]:
+    """Return (N(x), N(-x)) with one ndtr call.
+
+    The tail side is computed directly and the other as its complement,
+    which is at least 0.5 and so loses no precision.
+    """
+    if x > 0:
+        tail = ndtr(-x)
+        return 1.0 - tail, tail
+    cdf = ndtr(x)
+    return cdf, 1.0 - cdf
+
+
+def _pdf(x: float) -> float:
+    """Standard normal probability density."""
+    return _NORM_PDF_C * math.exp(-0.5 * x * x)
+
+
+def _ndtr(x: float) -> float:
+    """Standard normal CDF via erfc, usable inside Numba kernels."""
+    return 0.5 * math.erfc(-x * _SQRT1_2)
+
+
+def _bs_core(spot, strike, t, vol, rate):
+    """Price and Greeks for one option, in BATCH_FIELDS order.
+
+    Units match the BlackScholes methods: theta per day, vega and rho
+    per 1% change.
+    """
+    if t <= 0.0:
+        call = max(spot - strike, 0.0)
+        put = max(strike - spot, 0.0)
+        call_delta = 1.0 if spot > strike else 0.0
+        put_delta = -1.0 if spot < strike else 0.0
+        return (call, put, call_delta, put_delta,
+                0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    sqrt_t = math.sqrt(t)
+    vol_sqrt_t = vol * sqrt_t
+    d1 = (math.log(spot / strike) + (rate + 0.5 * vol * vol) * t) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    disc_strike = strike * math.exp(-rate * t)
+    nd1 = _NORM_PDF_C * math.exp(-0.5 * d1 * d1)
+    cdf_d1 = _ndtr(d1)
+    cdf_d2 = _ndtr(d2)
+    cdf_md1 = _ndtr(-d1)
+    cdf_md2 = _ndtr(-d2)
+    common = -(spot * nd1 * vol) / (2.0 * sqrt_t)
+    return (
+        spot * cdf_d1 - disc_strike * cdf_d2,
+        disc_strike * cdf_md2 - spot * cdf_md1,
+        cdf_d1,
+        cdf_d1 - 1.0,
+        nd1 / (spot * vol_sqrt_t),
+        spot * nd1 * sqrt_t / 100.0,
+        (common - rate * disc_strike * cdf_d2) / 365.0,
+        (common + rate * disc_strike * cdf_md2) / 365.0,
+        disc_strike * t * cdf_d2 / 100.0,
+        -disc_strike * t * cdf_md2 / 100.0,
+    )
+
+
+def _bs_batch(spots, strikes, ts, vols, rates, out):
+    """Fill ``out[:, i]`` with _bs_core results for each input row i."""
+    for i in _prange(spots.shape[0]):
+        res = _bs_core(spots[i], strikes[i], ts[i], vols[i], rates[i])
+        for j in range(len(res)):
+            out[j, i] = res[j]
+
+
+if numba is not None:
+    _prange = numba.prange
+    _ndtr = numba.njit(cache=True)(_ndtr)
+    _bs_core = numba.njit(cache=True)(_bs_core)
+    _bs_batch = numba.njit(parallel=True, cache=True)(_bs_batch)
+else:
+    _prange = range
 
 
 class BlackScholes:
     """Black-Scholes option pricing model.
 
+    The intermediate terms shared by the price and Greek formulas (d1, d2,
+    their normal CDFs and the discount factor) are computed once at
+    construction, so instances are read-only. Methods taking an
+    ``option_type`` accept 'call'/'put' or an ``OptType``.
+
     Args:
         spot: Current price of the underlying asset.
         strike: Strike price of the option.
@@ -15,134 +138,199 @@ class BlackScholes:
         rate: Risk-free interest rate (e.g., 0.05 for 5%).
     """
 
+    __slots__ = (
+        "_spot", "_strike", "_expiry_days", "_volatility", "_rate",
+        "_time_to_expiry", "_sqrt_t", "_disc",
+        "_d1", "_d2", "_Nd1", "_Nd2", "_Nmd1", "_Nmd2", "_nd1",
+    )
+
     def __init__(self, spot: float, strike: float, expiry_days: float,
                  volatility: float, rate: float = 0.05):
-        self.spot = spot
-        self.strike = strike
-        self.expiry_days = expiry_days
-        self.volatility = volatility
-        self.rate = rate
-        self._time_to_expiry = expiry_days / 365.0
+        self._spot = spot
+        self._strike = strike
+        self._expiry_days = expiry_days
+        self._volatility = volatility
+        self._rate = rate
+        t = expiry_days / 365.0
+        self._time_to_expiry = t
+        if t <= 0:
+            d1 = float('inf') if spot > strike else float('-inf')
+            self._sqrt_t = 0.0
+            self._disc = 1.0
+            self._d1 = self._d2 = d1
+            self._Nd1 = self._Nd2 = 1.0 if d1 > 0 else 0.0
+            self._Nmd1 = self._Nmd2 = 1.0 - self._Nd1
+            self._nd1 = 0.0
+            return
+        sqrt_t = math.sqrt(t)
+        d1 = (math.log(spot / strike) +
+              (rate + 0.5 * volatility ** 2) * t) / (volatility * sqrt_t)
+        d2 = d1 - volatility * sqrt_t
+        self._sqrt_t = sqrt_t
+        self._disc = math.exp(-rate * t)
+        self._d1 = d1
+        self._d2 = d2
+        self._Nd1, self._Nmd1 = _cdf_pair(d1)
+        self._Nd2, self._Nmd2 = _cdf_pair(d2)
+        self._nd1 = _pdf(d1)
+
+    @property
+    def spot(self) -> float:
+        return self._spot
+
+    @property
+    def strike(self) -> float:
+        return self._strike
+
+    @property
+    def expiry_days(self) -> float:
+        return self._expiry_days
+
+    @property
+    def volatility(self) -> float:
+        return self._volatility
+
+    @property
+    def rate(self) -> float:
+        return self._rate
 
     @property
     def time_to_expiry(self) -> float:
         return self._time_to_expiry
 
-    def _d1(self) -> float:
-        t = self.time_to_expiry
-        if t <= 0:
-            return float('inf') if self.spot > self.strike else float('-inf')
-        return (math.log(self.spot / self.strike) +
-                (self.rate + 0.5 * self.volatility ** 2) * t) / \
-               (self.volatility * math.sqrt(t))
+    @classmethod
+    def vectorized(cls, spot: float, strikes, expiry_days: float,
+                   volatility: float, rate: float = 0.05
+                   ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Price calls and puts for many strikes sharing spot, expiry and vol.
 
-    def _d2(self) -> float:
-        t = self.time_to_expiry
+        Args:
+            spot: Current price of the underlying asset.
+            strikes: Sequence or array of strike prices.
+            expiry_days: Days until expiration.
+            volatility: Annualized volatility.
+            rate: Risk-free interest rate.
+
+        Returns:
+            Arrays ``(call, put, d1, d2)``, one entry per strike.
+        """
+        strikes = np.asarray(strikes, dtype=float)
+        t = expiry_days / 365.0
         if t <= 0:
-            return self._d1()
-        return self._d1() - self.volatility * math.sqrt(t)
+            call = np.maximum(spot - strikes, 0.0)
+            put = np.maximum(strikes - spot, 0.0)
+            d1 = np.where(spot > strikes, np.inf, -np.inf)
+            return call, put, d1, d1.copy()
+        # Everything that does not depend on the strike is a Python scalar,
+        # so the array work is one log, one divide and the CDFs.
+        vol_sqrt_t = volatility * math.sqrt(t)
+        drift_t = (rate + 0.5 * volatility * volatility) * t
+        disc = math.exp(-rate * t)
+        d1 = (np.log(spot / strikes) + drift_t) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        disc_strikes = strikes * disc
+        call = spot * ndtr(d1) - disc_strikes * ndtr(d2)
+        put = disc_strikes * ndtr(-d2) - spot * ndtr(-d1)
+        return call, put, d1, d2
+
+    @staticmethod
+    def batch(spots, strikes, expiry_days, volatilities,
+              rates=0.05) -> dict[str, np.ndarray]:
+        """Price many independent options with all Greeks in one call.
+
+        Intended for enriching scan rows, where every row has its own
+        spot, strike and expiry. Arguments are broadcast against each
+        other, so scalars may be mixed with arrays. When Numba is
+        installed the loop is compiled and runs in parallel.
+
+        Returns:
+            Dict mapping each name in ``BATCH_FIELDS`` to an array with one
+            entry per option.
+        """
+        spots, strikes, expiry_days, volatilities, rates = (
+            np.ascontiguousarray(a, dtype=np.float64).ravel()
+            for a in np.broadcast_arrays(
+                spots, strikes, expiry_days, volatilities, rates)
+        )
+        out = np.empty((len(BATCH_FIELDS), spots.shape[0]))
+        _bs_batch(spots, strikes, expiry_days / 365.0, volatilities,
+                  rates, out)
+        return dict(zip(BATCH_FIELDS, out))
+
+    def _price(self, sign: int) -> float:
+        if self._time_to_expiry <= 0:
+            return max(sign * (self._spot - self._strike), 0.0)
+        if sign > 0:
+            return self._spot * self._Nd1 - self._strike * self._disc * self._Nd2
+        return self._strike * self._disc * self._Nmd2 - self._spot * self._Nmd1
 
     def call_price(self) -> float:
         """Calculate the theoretical call option price."""
-        t = self.time_to_expiry
-        if t <= 0:
-            return max(self.spot - self.strike, 0.0)
-        d1, d2 = self._d1(), self._d2()
-        return (self.spot * norm.cdf(d1) -
-                self.strike * math.exp(-self.rate * t) * norm.cdf(d2))
+        return self._price(1)
 
     def put_price(self) -> float:
         """Calculate the theoretical put option price."""
-        t = self.time_to_expiry
-        if t <= 0:
-            return max(self.strike - self.spot, 0.0)
-        d1, d2 = self._d1(), self._d2()
-        return (self.strike * math.exp(-self.rate * t) * norm.cdf(-d2) -
-                self.spot * norm.cdf(-d1))
+        return self._price(-1)
 
     def price(self, option_type: str) -> float:
         """Calculate option price by type ('call' or 'put')."""
-        if option_type == "call":
-            return self.call_price()
-        elif option_type == "put":
-            return self.put_price()
-        raise ValueError(f"option_type must be 'call' or 'put', got '{option_type}'")
+        return self._price(_as_sign(option_type))
 
     def delta(self, option_type: str) -> float:
         """Calculate delta (sensitivity to underlying price)."""
-        t = self.time_to_expiry
-        if t <= 0:
-            if option_type == "call":
-                return 1.0 if self.spot > self.strike else 0.0
-            return -1.0 if self.spot < self.strike else 0.0
-        d1 = self._d1()
-        if option_type == "call":
-            return norm.cdf(d1)
-        elif option_type == "put":
-            return norm.cdf(d1) - 1.0
-        raise ValueError(f"option_type must be 'call' or 'put', got '{option_type}'")
+        sign = _as_sign(option_type)
+        if self._time_to_expiry <= 0:
+            return float(sign) if sign * (self._spot - self._strike) > 0 else 0.0
+        # sign * N(sign * d1): N(d1) for calls, N(d1) - 1 = -N(-d1) for puts
+        return self._Nd1 if sign > 0 else -self._Nmd1
 
     def gamma(self) -> float:
         """Calculate gamma (rate of change of delta)."""
-        t = self.time_to_expiry
-        if t <= 0:
+        if self._time_to_expiry <= 0:
             return 0.0
-        d1 = self._d1()
-        return norm.pdf(d1) / (self.spot * self.volatility * math.sqrt(t))
+        return self._nd1 / (self._spot * self._volatility * self._sqrt_t)
 
     def theta(self, option_type: str) -> float:
         """Calculate theta (time decay per day)."""
-        t = self.time_to_expiry
-        if t <= 0:
+        sign = _as_sign(option_type)
+        if self._time_to_expiry <= 0:
             return 0.0
-        d1, d2 = self._d1(), self._d2()
-        common = -(self.spot * norm.pdf(d1) * self.volatility) / \
-                 (2.0 * math.sqrt(t))
-        if option_type == "call":
-            annual = common - self.rate * self.strike * \
-                     math.exp(-self.rate * t) * norm.cdf(d2)
-        elif option_type == "put":
-            annual = common + self.rate * self.strike * \
-                     math.exp(-self.rate * t) * norm.cdf(-d2)
-        else:
-            raise ValueError(f"option_type must be 'call' or 'put', got '{option_type}'")
+        common = -(self._spot * self._nd1 * self._volatility) / \
+                 (2.0 * self._sqrt_t)
+        signed_cdf_d2 = self._Nd2 if sign > 0 else -self._Nmd2
+        annual = common - self._rate * self._strike * self._disc * signed_cdf_d2
         return annual / 365.0
 
     def vega(self) -> float:
         """Calculate vega (sensitivity to volatility, per 1% change)."""
-        t = self.time_to_expiry
-        if t <= 0:
+        if self._time_to_expiry <= 0:
             return 0.0
-        d1 = self._d1()
-        return self.spot * norm.pdf(d1) * math.sqrt(t) / 100.0
+        return self._spot * self._nd1 * self._sqrt_t / 100.0
 
     def rho(self, option_type: str) -> float:
         """Calculate rho (sensitivity to interest rate, per 1% change)."""
-        t = self.time_to_expiry
+        sign = _as_sign(option_type)
+        t = self._time_to_expiry
         if t <= 0:
             return 0.0
-        d2 = self._d2()
-        if option_type == "call":
-            return self.strike * t * math.exp(-self.rate * t) * \
-                   norm.cdf(d2) / 100.0
-        elif option_type == "put":
-            return -self.strike * t * math.exp(-self.rate * t) * \
-                   norm.cdf(-d2) / 100.0
-        raise ValueError(f"option_type must be 'call' or 'put', got '{option_type}'")
+        signed_cdf_d2 = self._Nd2 if sign > 0 else -self._Nmd2
+        return self._strike * t * self._disc * signed_cdf_d2 / 100.0
 
     def greeks(self, option_type: str) -> dict:
         """Calculate all Greeks for the given option type."""
+        sign = _as_sign(option_type)
         return {
-            "delta": self.delta(option_type),
+            "delta": self.delta(sign),
             "gamma": self.gamma(),
-            "theta": self.theta(option_type),
+            "theta": self.theta(sign),
             "vega": self.vega(),
-            "rho": self.rho(option_type),
+            "rho": self.rho(sign),
         }
 
     def summary(self, option_type: str) -> dict:
         """Full pricing summary including price and all Greeks."""
+        sign = _as_sign(option_type)
         return {
-            "price": self.price(option_type),
-            **self.greeks(option_type),
+            "price": self._price(sign),
+            **self.greeks(sign),
         }
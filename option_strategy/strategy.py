@@ -1,15 +1,31 @@
 """Options strategy builder and P&L analysis."""
 
+import functools
+import threading
 from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # numba is optional; P&L falls back to NumPy
+    numba = None
 
-@dataclass
+# Signs used by the payoff formulas, looked up once per leg so the
+# formulas need no string compares.
+_TYPE_SIGN = {"call": 1.0, "put": -1.0}
+_DIR = {"long": 1, "short": -1}
+
+
+@dataclass(frozen=True, slots=True)
 class OptionLeg:
     """A single leg of an options strategy.
 
+    Legs are immutable, so the signs derived from them here and the leg
+    arrays cached by ``Strategy`` cannot go stale. Use
+    ``dataclasses.replace`` to get a modified leg.
+
     Args:
         option_type: 'call' or 'put'.
         strike: Strike price.
@@ -22,35 +38,36 @@ class OptionLeg:
     position: str
     premium: float
     quantity: int = 1
+    _call_sign: float = field(init=False, repr=False, compare=False)
+    _dir: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.option_type not in ("call", "put"):
-            raise ValueError(f"option_type must be 'call' or 'put', got '{self.option_type}'")
-        if self.position not in ("long", "short"):
-            raise ValueError(f"position must be 'long' or 'short', got '{self.position}'")
+        # Frozen, so the derived fields are set through object.__setattr__
+        try:
+            object.__setattr__(self, "_call_sign", _TYPE_SIGN[self.option_type])
+        except (KeyError, TypeError):  # TypeError: unhashable value
+            raise ValueError(f"option_type must be 'call' or 'put', got '{self.option_type}'") from None
+        try:
+            object.__setattr__(self, "_dir", _DIR[self.position])
+        except (KeyError, TypeError):
+            raise ValueError(f"position must be 'long' or 'short', got '{self.position}'") from None
         if self.quantity < 1:
             raise ValueError(f"quantity must be >= 1, got {self.quantity}")
 
     @property
     def direction(self) -> int:
         """Return +1 for long, -1 for short."""
-        return 1 if self.position == "long" else -1
+        return self._dir
 
     def payoff_at_expiry(self, spot: float) -> float:
         """Calculate the payoff of this leg at expiration for a given spot price."""
-        if self.option_type == "call":
-            intrinsic = max(spot - self.strike, 0.0)
-        else:
-            intrinsic = max(self.strike - spot, 0.0)
-        return self.direction * (intrinsic - self.premium) * self.quantity
+        intrinsic = max(self._call_sign * (spot - self.strike), 0.0)
+        return self._dir * (intrinsic - self.premium) * self.quantity
 
     def payoff_array(self, spots: np.ndarray) -> np.ndarray:
         """Calculate payoff across an array of spot prices."""
-        if self.option_type == "call":
-            intrinsic = np.maximum(spots - self.strike, 0.0)
-        else:
-            intrinsic = np.maximum(self.strike - spots, 0.0)
-        return self.direction * (intrinsic - self.premium) * self.quantity
+        intrinsic = np.maximum(self._call_sign * (spots - self.strike), 0.0)
+        return self._dir * (intrinsic - self.premium) * self.quantity
 
 
 @dataclass
@@ -60,41 +77,86 @@ class PnLResult:
     pnl: np.ndarray
     max_profit: float
     max_loss: float
-    breakevens: list[float]
+    breakevens: np.ndarray
+
+    def __post_init__(self):
+        # Not a field, so it stays out of fields(), asdict() and astuple()
+        self._str_cache: Optional[str] = None
 
     def __str__(self) -> str:
-        be_str = ", ".join(f"{b:.2f}" for b in self.breakevens)
-        return (f"Max Profit: {self.max_profit:.2f}\n"
-                f"Max Loss:   {self.max_loss:.2f}\n"
-                f"Breakevens: [{be_str}]")
+        # Results are not modified after construction, so format once
+        if self._str_cache is None:
+            be_str = ", ".join(f"{b:.2f}" for b in self.breakevens)
+            self._str_cache = (f"Max Profit: {self.max_profit:.2f}\n"
+                               f"Max Loss:   {self.max_loss:.2f}\n"
+                               f"Breakevens: [{be_str}]")
+        return self._str_cache
 
 
 @dataclass
 class Strategy:
     """An options strategy composed of one or more legs.
 
+    Leg data is cached as arrays for the P&L and premium calculations, and
+    the ``str()`` text is cached too. Add legs with ``add_leg``; mutating
+    ``legs`` directly bypasses the caches.
+
     Args:
         name: Descriptive name for the strategy.
     """
     name: str
     legs: list[OptionLeg] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Plain attributes rather than fields, so the caches stay out of
+        # fields(), asdict() and astuple()
+        self._arrays: Optional[tuple[np.ndarray, ...]] = None
+        self._str_cache: Optional[tuple[str, str]] = None
+
     def add_leg(self, leg: OptionLeg) -> None:
         """Add an option leg to the strategy."""
         self.legs.append(leg)
+        self._arrays = None
+        self._str_cache = None
+
+    def _as_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Leg attributes as parallel arrays, cached until the next add_leg.
+
+        Returns ``(strikes, premiums, dir_qty, call_sign)`` where ``dir_qty``
+        is direction times quantity and ``call_sign`` is +1 for calls and
+        -1 for puts. Mutating ``legs`` directly bypasses the cache.
+        """
+        if self._arrays is None:
+            self._arrays = (
+                np.array([leg.strike for leg in self.legs], dtype=float),
+                np.array([leg.premium for leg in self.legs], dtype=float),
+                np.array([leg._dir * leg.quantity for leg in self.legs],
+                         dtype=float),
+                np.array([leg._call_sign for leg in self.legs]),
+            )
+        return self._arrays
 
     @property
     def net_premium(self) -> float:
         """Net premium paid (positive) or received (negative)."""
-        return sum(leg.direction * leg.premium * leg.quantity for leg in self.legs)
+        _, premiums, dir_qty, _ = self._as_arrays()
+        return float(np.dot(dir_qty, premiums))
 
     def pnl_at_expiry(self, spot_range: Optional[tuple[float, float]] = None,
-                      num_points: int = 500) -> PnLResult:
+                      num_points: int = 500,
+                      dtype: np.dtype = np.float64) -> PnLResult:
         """Calculate P&L at expiration across a range of spot prices.
 
         Args:
             spot_range: (min_spot, max_spot) range to analyze. If None, auto-calculated.
-            num_points: Number of price points to evaluate.
+            num_points: Number of price points to evaluate. If 0 or less,
+                only the exact piecewise-linear P&L is returned: the range
+                ends and the strikes inside it. That is enough for the
+                summary statistics and far cheaper, especially for a
+                single leg, which is solved in closed form.
+            dtype: Float type of the returned spots and P&L arrays. float32
+                halves memory traffic for large sweeps; breakevens are
+                always solved in float64.
         """
         if not self.legs:
             raise ValueError("Strategy has no legs")
@@ -106,51 +168,284 @@ class Strategy:
             margin = max(spread, center * 0.2)
             spot_range = (center - margin, center + margin)
 
-        spots = np.linspace(spot_range[0], spot_range[1], num_points)
-        total_pnl = np.zeros_like(spots)
+        dtype = np.dtype(dtype)
+        if num_points <= 0:
+            return self._pnl_stats_only(spot_range, dtype)
+        spots = np.linspace(spot_range[0], spot_range[1], num_points, dtype=dtype)
 
-        for leg in self.legs:
-            total_pnl += leg.payoff_array(spots)
-
-        max_profit = float(np.max(total_pnl))
-        max_loss = float(np.min(total_pnl))
+        arrays = self._as_arrays()
+        total_pnl = np.empty_like(spots)
+        if dtype == np.float64:
+            max_profit, max_loss = _pnl(spots, *arrays, total_pnl)
+        else:
+            max_profit, max_loss = _pnl_generic(
+                spots, *(a.astype(dtype) for a in arrays), total_pnl)
 
-        breakevens = _find_breakevens(spots, total_pnl)
+        breakevens = _find_breakevens_exact(*_pnl_at_kinks(spot_range, *arrays))
 
         return PnLResult(
             spots=spots,
             pnl=total_pnl,
-            max_profit=max_profit,
-            max_loss=max_loss,
+            max_profit=float(max_profit),
+            max_loss=float(max_loss),
+            breakevens=breakevens,
+        )
+
+    def _pnl_stats_only(self, spot_range: tuple[float, float],
+                        dtype: np.dtype) -> PnLResult:
+        """P&L evaluated only at the range ends and the strikes inside it.
+
+        The range may be given in either order; spots are returned sorted.
+        """
+        if len(self.legs) == 1:
+            # One leg is monotonic with a single kink and breakeven
+            leg = self.legs[0]
+            lo, hi = sorted(spot_range)
+            x = [lo, leg.strike, hi] if lo < leg.strike < hi else [lo, hi]
+            y = [leg.payoff_at_expiry(v) for v in x]
+            be = leg.strike + leg._call_sign * leg.premium
+            breakevens = [be] if leg.premium > 0 and lo < be < hi else []
+            spots = np.array(x, dtype=dtype)
+            pnl = np.array(y, dtype=dtype)
+            breakevens = np.round(np.array(breakevens, dtype=float), 2)
+        else:
+            x, y = _pnl_at_kinks(spot_range, *self._as_arrays())
+            breakevens = _find_breakevens_exact(x, y)
+            spots, pnl = x.astype(dtype), y.astype(dtype)
+        return PnLResult(
+            spots=spots,
+            pnl=pnl,
+            max_profit=float(pnl.max()),
+            max_loss=float(pnl.min()),
             breakevens=breakevens,
         )
 
+    @staticmethod
+    def pnl_batch(strategies: list["Strategy"], spots) -> np.ndarray:
+        """P&L at expiration for many strategies over shared spot prices.
+
+        Strategies with fewer legs are padded with zero-quantity legs so
+        the whole batch is one (strategies, legs, spots) array expression.
+        It runs on the GPU through CuPy when a CUDA device is available,
+        otherwise with NumPy.
+
+        Args:
+            strategies: Strategies to evaluate; each needs at least one leg.
+            spots: Spot prices to evaluate every strategy at.
+
+        Returns:
+            Array of shape ``(len(strategies), len(spots))``.
+        """
+        if any(not s.legs for s in strategies):
+            raise ValueError("Strategy has no legs")
+        n_legs = max((len(s.legs) for s in strategies), default=0)
+        packed = np.zeros((4, len(strategies), n_legs))
+        for row, s in enumerate(strategies):
+            packed[:, row, :len(s.legs)] = s._as_arrays()
+
+        xp = _gpu_array_module() or np
+        strikes, premiums, dir_qty, call_sign = xp.asarray(packed)
+        spots = xp.asarray(spots, dtype=float)
+        grid = call_sign[:, :, None] * (spots[None, None, :] - strikes[:, :, None])
+        xp.maximum(grid, 0.0, out=grid)
+        grid -= premiums[:, :, None]
+        grid *= dir_qty[:, :, None]
+        total = grid.sum(axis=1)
+        return total.get() if xp is not np else total
+
     def __str__(self) -> str:
-        lines = [f"Strategy: {self.name}"]
-        for i, leg in enumerate(self.legs, 1):
-            lines.append(
-                f"  Leg {i}: {leg.position.upper()} {leg.quantity}x "
-                f"{leg.option_type.upper()} @ {leg.strike:.2f} "
-                f"(premium: {leg.premium:.2f})"
-            )
-        lines.append(f"  Net Premium: {self.net_premium:.2f}")
-        return "\n".join(lines)
+        """Describe the strategy; cached until the next add_leg or rename."""
+        # The cache is keyed on the name, which is a public mutable field
+        if self._str_cache is None or self._str_cache[0] != self.name:
+            lines = [f"Strategy: {self.name}"]
+            for i, leg in enumerate(self.legs, 1):
+                lines.append(
+                    f"  Leg {i}: {leg.position.upper()} {leg.quantity}x "
+                    f"{leg.option_type.upper()} @ {leg.strike:.2f} "
+                    f"(premium: {leg.premium:.2f})"
+                )
+            lines.append(f"  Net Premium: {self.net_premium:.2f}")
+            self._str_cache = (self.name, "\n".join(lines))
+        return self._str_cache[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _gpu_array_module():
+    """Return the cupy module if a CUDA device is usable, else None.
+
+    Imported lazily because importing CuPy is slow and most callers never
+    need it.
+    """
+    try:
+        import cupy
+    except ImportError:
+        return None
+    try:
+        return cupy if cupy.cuda.is_available() else None
+    except Exception:  # broken CUDA driver/runtime installs
+        return None
+
+
+_scratch = threading.local()
 
+# Largest request served from the scratch buffer, in elements. Bigger
+# temporaries are allocated fresh so they are freed after the call
+# instead of staying pinned on the thread.
+_SCRATCH_MAX = 65536
 
-def _find_breakevens(spots: np.ndarray, pnl: np.ndarray) -> list[float]:
-    """Find approximate breakeven points where P&L crosses zero."""
-    breakevens = []
-    for i in range(len(pnl) - 1):
-        if pnl[i] * pnl[i + 1] < 0:
-            # Linear interpolation for the zero crossing
-            fraction = abs(pnl[i]) / (abs(pnl[i]) + abs(pnl[i + 1]))
-            be = spots[i] + fraction * (spots[i + 1] - spots[i])
-            breakevens.append(round(float(be), 2))
-    return breakevens
+
+def _get_scratch(n: int, dtype=np.float64) -> np.ndarray:
+    """Return a reusable buffer of ``n`` elements private to this thread.
+
+    Only for temporaries that never escape the caller: the contents are
+    overwritten by the next call on the same thread. Requests above
+    ``_SCRATCH_MAX`` get a new array.
+    """
+    if n > _SCRATCH_MAX:
+        return np.empty(n, dtype=dtype)
+    bufs = getattr(_scratch, "bufs", None)
+    if bufs is None:
+        bufs = _scratch.bufs = {}
+    dtype = np.dtype(dtype)
+    buf = bufs.get(dtype)
+    if buf is None or buf.size < n:
+        buf = bufs[dtype] = np.empty(max(n, 4096), dtype=dtype)
+    return buf[:n]
+
+
+def _pnl_numpy(spots, strikes, premiums, dir_qty, call_sign, out):
+    """Write total P&L at each spot into ``out`` using NumPy broadcasting.
+
+    Returns ``(max, min)`` of the written P&L, like ``_pnl_kernel``.
+    """
+    # All legs at once: an (L, N) intrinsic-value grid reduced over legs,
+    # built in a per-thread scratch buffer so sweeps do not reallocate it
+    grid = _get_scratch(strikes.size * spots.size, spots.dtype).reshape(
+        strikes.size, spots.size)
+    np.subtract(spots[None, :], strikes[:, None], out=grid)
+    grid *= call_sign[:, None]
+    # In place np.maximum is one SIMD pass; the branchless
+    # (x + |x|) * 0.5 form needs three and measures 2-3x slower.
+    np.maximum(grid, 0.0, out=grid)
+    grid -= premiums[:, None]
+    # Weighting by dir_qty and summing over legs is one matrix-vector
+    # product, which BLAS does in a single pass over the grid
+    np.dot(dir_qty, grid, out=out)
+    return out.max(), out.min()
+
+
+def _pnl_kernel(spots, strikes, premiums, dir_qty, call_sign, out):
+    """Write total P&L at each spot into ``out``, one spot per iteration.
+
+    Compiled with Numba when available: spots run in parallel and the leg
+    loop is vectorized without temporary arrays. The max and min P&L are
+    tracked in the same pass and returned as ``(max, min)``, so the
+    caller does not reread ``out``.
+    """
+    mx = -np.inf
+    mn = np.inf
+    for j in _prange(spots.shape[0]):
+        s = spots[j]
+        acc = 0.0
+        for i in range(strikes.shape[0]):
+            d = call_sign[i] * (s - strikes[i])
+            intrinsic = d if d > 0.0 else 0.0
+            acc += (intrinsic - premiums[i]) * dir_qty[i]
+        out[j] = acc
+        # Reduce over the stored value so float32 output matches its max/min
+        mx = max(mx, out[j])
+        mn = min(mn, out[j])
+    return mx, mn
+
+
+if numba is not None:
+    _prange = numba.prange
+    _pnl_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(_pnl_kernel)
+    _pnl_generic = _pnl_kernel
+else:
+    _prange = range
+    _pnl_generic = _pnl_numpy
+
+# _pnl_generic accepts any float dtype; _pnl is used for float64. Prebuilt
+# float64 kernels need neither Numba nor a JIT warm-up, so they take
+# precedence when present: the C/AVX2 library (see _kernels_build.py),
+# then the Numba AOT module (see _strategy_aot.py).
+_pnl = _pnl_generic
+try:
+    from option_strategy._ckernel import pnl_kernel as _pnl
+except ImportError:
+    try:
+        from option_strategy.strategy_kernels import pnl_kernel as _pnl
+    except ImportError:
+        pass
+
+
+def _pnl_at_kinks(spot_range: tuple[float, float], strikes: np.ndarray,
+                  premiums: np.ndarray, dir_qty: np.ndarray,
+                  call_sign: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return sorted spots ``x`` and their P&L ``y`` at the payoff's kinks.
+
+    P&L at expiry is linear between strikes, so its values at the range
+    ends and the strikes inside ``spot_range`` describe it exactly. The
+    range may be given in either order.
+    """
+    lo, hi = sorted(spot_range)
+    inner = strikes[(strikes > lo) & (strikes < hi)]
+    x = np.unique(np.concatenate(([lo, hi], inner)).astype(float))
+    y = np.empty_like(x)
+    _pnl(x, strikes, premiums, dir_qty, call_sign, y)
+    return x, y
+
+
+def _find_breakevens_exact(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Find breakeven points exactly from the P&L at the payoff's kinks.
+
+    Takes the output of ``_pnl_at_kinks`` and solves each sign-changing
+    segment for its zero, which costs O(legs) regardless of how finely
+    the range is sampled.
+    """
+    x0, x1, y0, y1 = x[:-1], x[1:], y[:-1], y[1:]
+    i = np.nonzero(y0 * y1 < 0)[0]
+    breakevens = x0[i] - y0[i] * (x1[i] - x0[i]) / (y1[i] - y0[i])
+    # Kinks that sit exactly on zero between a loss and a profit
+    z = np.nonzero(y[1:-1] == 0)[0] + 1
+    z = z[y[z - 1] * y[z + 1] < 0]
+    if z.size:
+        breakevens = np.sort(np.concatenate([breakevens, x[z]]))
+    return np.round(breakevens, 2)
 
 
 # --- Preset strategy constructors ---
 
+def _preset(func):
+    """Memoize the legs a preset constructor builds.
+
+    Backtests call the presets repeatedly with the same arguments. Legs
+    are immutable, so repeat calls reuse the cached legs and their leg
+    arrays (made read-only), but every call returns a new ``Strategy``
+    that the caller is free to extend.
+    """
+    @functools.lru_cache(maxsize=1024)
+    def build(*args, **kwargs):
+        s = func(*args, **kwargs)
+        arrays = s._as_arrays()
+        for a in arrays:
+            a.flags.writeable = False
+        return s.name, tuple(s.legs), arrays
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        name, legs, arrays = build(*args, **kwargs)
+        s = Strategy(name, list(legs))
+        s._arrays = arrays
+        return s
+
+    wrapper.cache_clear = build.cache_clear
+    wrapper.cache_info = build.cache_info
+    return wrapper
+
+
+@_preset
 def long_call(spot: float, strike: float, premium: float) -> Strategy:
     """Create a long call strategy."""
     s = Strategy("Long Call")
@@ -158,6 +453,7 @@ def long_call(spot: float, strike: float, premium: float) -> Strategy:
     return s
 
 
+@_preset
 def long_put(spot: float, strike: float, premium: float) -> Strategy:
     """Create a long put strategy."""
     s = Strategy("Long Put")
@@ -165,6 +461,7 @@ def long_put(spot: float, strike: float, premium: float) -> Strategy:
     return s
 
 
+@_preset
 def bull_call_spread(spot: float, lower_strike: float, upper_strike: float,
                      lower_premium: float, upper_premium: float) -> Strategy:
     """Create a bull call spread (buy lower strike call, sell upper strike call)."""
@@ -174,6 +471,7 @@ def bull_call_spread(spot: float, lower_strike: float, upper_strike: float,
     return s
 
 
+@_preset
 def bear_put_spread(spot: float, lower_strike: float, upper_strike: float,
                     lower_premium: float, upper_premium: float) -> Strategy:
     """Create a bear put spread (buy upper strike put, sell lower strike put)."""
@@ -183,6 +481,7 @@ def bear_put_spread(spot: float, lower_strike: float, upper_strike: float,
     return s
 
 
+@_preset
 def straddle(spot: float, strike: float,
              call_premium: float, put_premium: float) -> Strategy:
     """Create a long straddle (buy call and put at same strike)."""
@@ -192,6 +491,7 @@ def straddle(spot: float, strike: float,
     return s
 
 
+@_preset
 def strangle(spot: float, call_strike: float, put_strike: float,
              call_premium: float, put_premium: float) -> Strategy:
     """Create a long strangle (buy OTM call and OTM put)."""
@@ -201,6 +501,7 @@ def strangle(spot: float, call_strike: float, put_strike: float,
     return s
 
 
+@_preset
 def iron_condor(spot: float, put_lower: float, put_upper: float,
                 call_lower: float, call_upper: float,
                 put_lower_prem: float, put_upper_prem: float,
@@ -217,6 +518,7 @@ def iron_condor(spot: float, put_lower: float, put_upper: float,
     return s
 
 
+@_preset
 def butterfly_spread(spot: float, lower: float, middle: float, upper: float,
                      lower_prem: float, middle_prem: float,
                      upper_prem: float) -> Strategy:
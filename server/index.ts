@@ -6,7 +6,8 @@ import cors from 'cors';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { runMigrations } from './db/migrate.js';
-import { startCronJobs } from './cron.js';
+import { startCronJobs, stopCronJobs } from './cron.js';
+import { closeBrowser } from './services/scraper.js';
 import optionAutomationRoutes from './routes/optionAutomation.js';
 import optionScansRoutes from './routes/optionScans.js';
 import optionPortfoliosRoutes from './routes/optionPortfolios.js';
@@ -63,4 +64,14 @@ async function start() {
   }
 }
 
+async function shutdown(signal: string) {
+  console.log(`[Server] ${signal} received, shutting down...`);
+  stopCronJobs();
+  await closeBrowser();
+  process.exit(0);
+}
+
+process.on('SIGINT', () => shutdown('SIGINT'));
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+
 start();
@@ -1,5 +1,5 @@
 import { Router } from 'express';
-import { scrapeOptionSamurai, testLogin } from '../services/scraper.js';
+import { scrapeOptionSamurai, scrapeOptionSamuraiScans, testLogin } from '../services/scraper.js';
 import {
   saveScanResults,
   scanExistsForDate,
@@ -76,6 +76,76 @@ router.post('/scan', async (req, res) => {
   }
 });
 
+/**
+ * POST /api/option-automation/scan-batch
+ * Run several Option Samurai scans with one login and save each result set.
+ * Scans that already exist for today are skipped unless overwrite=true.
+ * Existing data is only replaced for scans that returned rows; scans that
+ * fail are listed in `failed` and keep their previous data.
+ */
+router.post('/scan-batch', async (req, res) => {
+  try {
+    const scanNames = req.body?.scanNames;
+    if (!Array.isArray(scanNames) || scanNames.length === 0 ||
+        !scanNames.every((name: unknown) => typeof name === 'string' && name)) {
+      return res.status(400).json({
+        success: false,
+        message: 'scanNames must be a non-empty array of scan names',
+      });
+    }
+    const overwrite = req.body?.overwrite === true;
+    const scanDate = getTodayET();
+
+    const toRun: string[] = [];
+    const toReplace = new Set<string>();
+    const skipped: string[] = [];
+    for (const scanName of scanNames as string[]) {
+      const exists = await scanExistsForDate(scanDate, scanName);
+      if (exists && !overwrite) {
+        skipped.push(scanName);
+        continue;
+      }
+      if (exists) toReplace.add(scanName);
+      toRun.push(scanName);
+    }
+
+    const resultCounts: Record<string, number> = {};
+    const failed: Record<string, string> = {};
+    if (toRun.length > 0) {
+      console.log(`[API] Running ${toRun.length} scans for ${scanDate}...`);
+      const { results, failures } = await scrapeOptionSamuraiScans(toRun);
+      for (const [scanName, message] of failures) {
+        failed[scanName] = message;
+      }
+      for (const [scanName, rows] of results) {
+        if (rows.length === 0) {
+          resultCounts[scanName] = 0;
+          continue;
+        }
+        if (toReplace.has(scanName)) {
+          console.log(`[API] Overwriting existing scan data for ${scanDate} (${scanName})`);
+          await deleteScanDataForDate(scanDate, scanName);
+        }
+        resultCounts[scanName] = await saveScanResults(rows, scanName, scanDate);
+      }
+    }
+
+    const failedCount = Object.keys(failed).length;
+    res.json({
+      success: failedCount === 0,
+      message: `Ran ${toRun.length} scans (${failedCount} failed), ` +
+        `skipped ${skipped.length} existing`,
+      scanDate,
+      resultCounts,
+      failed,
+      skipped,
+    });
+  } catch (error: any) {
+    console.error('[API] Scan batch error:', error.message);
+    res.status(500).json({ success: false, message: error.message });
+  }
+});
+
 /**
  * POST /api/option-automation/monday-workflow
  * Full Monday workflow: check market open, scan, create portfolios.
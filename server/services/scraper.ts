@@ -1,5 +1,7 @@
-import { chromium, type Browser, type Page } from 'playwright';
+import type { Browser, BrowserContext, Locator, Page } from 'playwright';
 import { parse } from 'csv-parse/sync';
+import fs from 'fs/promises';
+import path from 'path';
 import { parseExpirationDate } from '../utils/dates.js';
 import type { ScanResultRow } from '../../shared/types.js';
 
@@ -11,6 +13,34 @@ function log(step: string, msg: string) {
   console.log(`[Scraper][${step}] ${msg}`);
 }
 
+const UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ';
+const LOWERCASE = 'abcdefghijklmnopqrstuvwxyz';
+
+/**
+ * Quote a string as an XPath 1.0 literal. XPath has no escape sequences,
+ * so values containing both quote characters are built with concat().
+ */
+function xpathLiteral(value: string): string {
+  if (!value.includes("'")) return `'${value}'`;
+  if (!value.includes('"')) return `"${value}"`;
+  return `concat('${value.split("'").join(`', "'", '`)}')`;
+}
+
+/**
+ * Return the first element matched by the earliest selector in the list
+ * that matches anything, or null. The selectors are counted concurrently,
+ * so the lookup costs one round trip of latency while list order, not DOM
+ * order, still decides which element wins.
+ */
+async function firstMatching(
+  scope: Page | Locator,
+  selectors: string[],
+): Promise<Locator | null> {
+  const counts = await Promise.all(selectors.map((s) => scope.locator(s).count()));
+  const index = counts.findIndex((n) => n > 0);
+  return index === -1 ? null : scope.locator(selectors[index]).first();
+}
+
 async function takeScreenshot(page: Page, step: string) {
   try {
     const path = `/tmp/optionsamurai_${step}_${Date.now()}.png`;
@@ -21,6 +51,267 @@ async function takeScreenshot(page: Page, step: string) {
   }
 }
 
+// ---------------------------------------------------------------------------
+// Browser
+// ---------------------------------------------------------------------------
+
+let browserPromise: Promise<Browser> | null = null;
+
+/**
+ * Return the shared Chromium instance, launching it on first use.
+ *
+ * Browser startup dominates the cost of a short scrape, so one Chromium is
+ * kept alive for the life of the server. Every run still gets its own
+ * BrowserContext, which keeps cookies and storage isolated between logins.
+ * If the browser crashes or is closed, the next call launches a new one.
+ */
+function getBrowser(): Promise<Browser> {
+  if (!browserPromise) {
+    log('INIT', 'Launching Chromium...');
+    // Playwright is loaded on first use so server startup and routes that
+    // never scrape do not pay for importing it.
+    const launching: Promise<Browser> = import('playwright')
+      .then(({ chromium }) => chromium.launch({
+        headless: true,
+        // Docker caps /dev/shm at 64MB, which crashes renderers on large
+        // pages; --disable-dev-shm-usage makes Chromium use /tmp instead.
+        // Chromium keeps its default multi-process model.
+        args: [
+          '--no-sandbox',
+          '--disable-setuid-sandbox',
+          '--disable-dev-shm-usage',
+          '--blink-settings=imagesEnabled=false',
+        ],
+      }))
+      .then((browser) => {
+        browser.on('disconnected', () => {
+          log('CLEANUP', 'Browser disconnected');
+          // A late disconnect must not forget a browser launched since
+          if (browserPromise === launching) browserPromise = null;
+        });
+        return browser;
+      })
+      .catch((err) => {
+        if (browserPromise === launching) browserPromise = null;
+        throw err;
+      });
+    browserPromise = launching;
+  }
+  return browserPromise;
+}
+
+/**
+ * Close the shared browser, if one is running. Called on server shutdown.
+ */
+export async function closeBrowser(): Promise<void> {
+  if (!browserPromise) return;
+  const pending = browserPromise;
+  browserPromise = null;
+  try {
+    const browser = await pending;
+    await browser.close();
+  } catch {
+    // A failed launch leaves nothing to close
+  }
+}
+
+/**
+ * Resource types the scraper never reads. Stylesheets are still loaded
+ * because Playwright's visibility and click checks depend on layout.
+ */
+const BLOCKED_RESOURCE_TYPES = new Set(['image', 'font', 'media']);
+
+/**
+ * Third-party analytics, ad and chat hosts that fire on every navigation
+ * and hold up the load event without affecting the scan data.
+ */
+const BLOCKED_URL_PATTERN =
+  /googletagmanager|google-analytics|doubleclick|segment\.(io|com)|intercom|hotjar|facebook\.net/i;
+
+/**
+ * Open an isolated context on the shared browser that skips downloading
+ * images, fonts, media and third-party trackers. Pass `storageState` to
+ * start from a previously saved login session.
+ */
+async function newScraperContext(storageState?: StorageState): Promise<BrowserContext> {
+  const browser = await getBrowser();
+  const context = await browser.newContext({ storageState });
+  await context.route('**/*', (route) => {
+    const request = route.request();
+    if (BLOCKED_RESOURCE_TYPES.has(request.resourceType()) || BLOCKED_URL_PATTERN.test(request.url())) {
+      return route.abort();
+    }
+    return route.continue();
+  });
+  return context;
+}
+
+// ---------------------------------------------------------------------------
+// Saved session
+// ---------------------------------------------------------------------------
+
+type StorageState = Awaited<ReturnType<BrowserContext['storageState']>>;
+
+interface SavedSession {
+  email: string;
+  screenerUrl: string;
+  savedAt: number;
+  state: StorageState;
+}
+
+const SESSION_FILE = path.join(process.env.DATA_DIR || '/data', 'optionsamurai-session.json');
+
+/** Saved sessions older than this are ignored and a fresh login is done. */
+const SESSION_MAX_AGE_MS = 12 * 60 * 60 * 1000;
+
+/**
+ * Load the saved Option Samurai session for `email`, or null if there is
+ * none, it belongs to another account, or it has expired.
+ */
+async function loadSession(email: string): Promise<SavedSession | null> {
+  try {
+    const saved: SavedSession = JSON.parse(await fs.readFile(SESSION_FILE, 'utf-8'));
+    if (saved.email !== email || Date.now() - saved.savedAt > SESSION_MAX_AGE_MS) {
+      return null;
+    }
+    return saved;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Persist the context's cookies and storage so later runs can skip the
+ * login flow. Failures are logged and otherwise ignored.
+ */
+async function saveSession(context: BrowserContext, email: string, screenerUrl: string): Promise<void> {
+  try {
+    const saved: SavedSession = {
+      email,
+      screenerUrl,
+      savedAt: Date.now(),
+      state: await context.storageState(),
+    };
+    await fs.mkdir(path.dirname(SESSION_FILE), { recursive: true });
+    await fs.writeFile(SESSION_FILE, JSON.stringify(saved), { mode: 0o600 });
+    log('SESSION', `Saved session to ${SESSION_FILE}`);
+  } catch (e: any) {
+    log('SESSION', `Could not save session: ${e.message}`);
+  }
+}
+
+/**
+ * Check whether a context restored from a saved session is still logged
+ * in by opening the screener and waiting briefly for Saved Scans.
+ */
+async function resumeSession(page: Page, screenerUrl: string): Promise<boolean> {
+  try {
+    await page.goto(screenerUrl, { waitUntil: 'domcontentloaded', timeout: 60000 });
+    await page.waitForSelector('text=Saved Scans', { timeout: 15000 });
+    return page.url() === screenerUrl;
+  } catch {
+    return false;
+  }
+}
+
+// ---------------------------------------------------------------------------
+// login
+// ---------------------------------------------------------------------------
+
+/**
+ * Log in to Option Samurai from the homepage and wait for the screener.
+ */
+async function login(page: Page, email: string, password: string): Promise<void> {
+  // Step 1: Navigate to homepage
+  log('STEP1', 'Navigating to homepage...');
+  await page.goto('https://optionsamurai.com', { waitUntil: 'domcontentloaded', timeout: 60000 });
+
+  // Step 2: Click Login
+  log('STEP2', 'Looking for Login button...');
+  const loginSelectors = [
+    'a[href*="login"]',
+    'button:has-text("Login")',
+    'a:has-text("Login")',
+    'a:has-text("LOG IN")',
+    'button:has-text("LOG IN")',
+  ];
+
+  const loginButton = await firstMatching(page, loginSelectors);
+  if (!loginButton) {
+    await takeScreenshot(page, 'login_button_not_found');
+    throw new Error('Login button not found');
+  }
+  await loginButton.click();
+
+  await page.waitForURL('**/login**', { timeout: 30000 });
+  log('STEP2', 'On login page');
+
+  // Step 3: Fill credentials
+  log('STEP3', 'Filling credentials...');
+  await page.waitForSelector('input[type="email"], input[name="email"], input[placeholder*="email" i]', { timeout: 10000 });
+  await page.locator('input[type="email"], input[name="email"], input[placeholder*="email" i]').first().fill(email);
+  await page.locator('input[type="password"], input[name="password"]').first().fill(password);
+
+  // Step 4: Submit login
+  log('STEP4', 'Clicking LOG IN...');
+  const submitSelectors = [
+    'button:has-text("LOG IN")',
+    'button:has-text("Log In")',
+    'button[type="submit"]',
+    'input[type="submit"]',
+  ];
+
+  // Prefer a button inside the login form so another submit button on the
+  // page cannot be picked up. SPA markup often renders LOG IN outside the
+  // <form>, so fall back to the whole page.
+  const loginForm = page.locator('form:has(input[type="password"])');
+  const submitButton =
+    ((await loginForm.count()) > 0
+      ? await firstMatching(loginForm.first(), submitSelectors)
+      : null) ?? (await firstMatching(page, submitSelectors));
+  if (!submitButton) {
+    await takeScreenshot(page, 'submit_not_found');
+    throw new Error('Submit button not found');
+  }
+  await submitButton.click();
+
+  await page.waitForURL('**/screener**', { timeout: 60000 });
+  log('STEP4', 'Logged in successfully');
+}
+
+/**
+ * Open a logged-in page on the screener, reusing the saved session when
+ * the site still accepts it and falling back to a full login otherwise.
+ */
+async function openSession(
+  email: string,
+  password: string,
+): Promise<{ context: BrowserContext; page: Page; screenerUrl: string }> {
+  const saved = await loadSession(email);
+  if (saved) {
+    const context = await newScraperContext(saved.state);
+    const page = await context.newPage();
+    if (await resumeSession(page, saved.screenerUrl)) {
+      log('SESSION', 'Reusing saved session');
+      return { context, page, screenerUrl: saved.screenerUrl };
+    }
+    log('SESSION', 'Saved session rejected, logging in again');
+    await context.close();
+  }
+
+  const context = await newScraperContext();
+  try {
+    const page = await context.newPage();
+    await login(page, email, password);
+    const screenerUrl = page.url();
+    await saveSession(context, email, screenerUrl);
+    return { context, page, screenerUrl };
+  } catch (error) {
+    await context.close();
+    throw error;
+  }
+}
+
 // ---------------------------------------------------------------------------
 // testLogin
 // ---------------------------------------------------------------------------
@@ -36,30 +327,12 @@ export async function testLogin(): Promise<{ success: boolean; message: string }
     };
   }
 
-  let browser: Browser | null = null;
+  let context: BrowserContext | null = null;
   try {
-    browser = await chromium.launch({
-      headless: true,
-      args: ['--no-sandbox', '--disable-setuid-sandbox'],
-    });
-
-    const context = await browser.newContext();
+    context = await newScraperContext();
     const page = await context.newPage();
 
-    await page.goto('https://optionsamurai.com', { waitUntil: 'domcontentloaded', timeout: 60000 });
-
-    // Click login link
-    await page.click('a[href*="login"], button:has-text("Login"), a:has-text("Login")');
-    await page.waitForURL('**/login**', { timeout: 30000 });
-
-    // Fill credentials
-    await page.waitForSelector('input[type="email"], input[name="email"], input[placeholder*="email" i]', { timeout: 10000 });
-    await page.fill('input[type="email"], input[name="email"], input[placeholder*="email" i]', email);
-    await page.fill('input[type="password"], input[name="password"]', password);
-
-    // Submit
-    await page.click('button:has-text("LOG IN"), button:has-text("Log In"), button[type="submit"]');
-    await page.waitForURL('**/screener**', { timeout: 60000 });
+    await login(page, email, password);
 
     const isLoggedIn = await page.locator('text=Saved Scans').isVisible({ timeout: 10000 });
     return {
@@ -69,14 +342,204 @@ export async function testLogin(): Promise<{ success: boolean; message: string }
   } catch (err: any) {
     return { success: false, message: `Login error: ${err.message}` };
   } finally {
-    if (browser) await browser.close();
+    if (context) await context.close();
   }
 }
 
+// ---------------------------------------------------------------------------
+// CSV columns
+// ---------------------------------------------------------------------------
+
+/**
+ * Option Samurai CSV header names for each scan field, in order of
+ * preference. The export has used several spellings over time.
+ */
+const SCAN_CSV_COLUMNS = {
+  ticker: ['Underlying', 'Ticker', 'Symbol'],
+  companyName: ['Company Name', 'Name'],
+  price: ['Stock Last', 'Price'],
+  priceChange: ['Price Change', '% Change'],
+  ivRank: ['Stock Iv', 'IV Rank'],
+  ivPercentile: ['IV Percentile'],
+  strike: ['Strike'],
+  moneyness: ['Moneyness'],
+  expDate: ['expDate', 'Expiration Di', 'Expiration Date', 'Exp. Date', 'Expiration'],
+  daysToExp: ['Days To Exp', 'Days To Expiration', 'DTE'],
+  totalOptVol: ['Total Vol', 'Total Opt. Vol.', 'Volume'],
+  probMaxProfit: ['Prob Max Pro', 'Prob Max Profit', 'Prob. of Max. Profit'],
+  maxProfit: ['Max Profit', 'Max. Profit'],
+  maxLoss: ['Max Loss', 'Max. Loss'],
+  returnPercent: ['Return Acqui', 'Return Acquisition', 'Return %'],
+} as const;
+
+type ScanCsvField = keyof typeof SCAN_CSV_COLUMNS;
+
+/**
+ * Map a CSV header row to csv-parse column names.
+ *
+ * Each field is resolved to its first alias present in the header, once
+ * per file, so rows come back keyed by field name instead of being probed
+ * alias by alias. Unused columns map to false and are dropped.
+ */
+function resolveScanColumns(header: string[]): (ScanCsvField | false)[] {
+  const columns: (ScanCsvField | false)[] = header.map(() => false);
+  for (const field of Object.keys(SCAN_CSV_COLUMNS) as ScanCsvField[]) {
+    for (const alias of SCAN_CSV_COLUMNS[field]) {
+      const index = header.indexOf(alias);
+      if (index !== -1 && columns[index] === false) {
+        columns[index] = field;
+        break;
+      }
+    }
+  }
+  return columns;
+}
+
+// ---------------------------------------------------------------------------
+// runScan
+// ---------------------------------------------------------------------------
+
+/**
+ * Open a saved scan on a logged-in page, export it as CSV, and parse the
+ * rows into raw ScanResultRow values.
+ *
+ * The page is first sent to `screenerUrl` unless it is already there, so
+ * one page can run several scans and fresh pages in a logged-in context
+ * can start from the Saved Scans list.
+ */
+async function runScan(page: Page, scanName: string, screenerUrl: string): Promise<ScanResultRow[]> {
+  if (page.url() !== screenerUrl) {
+    await page.goto(screenerUrl, { waitUntil: 'domcontentloaded', timeout: 60000 });
+  }
+
+  // Step 5: Find and click the saved scan
+  // Wait on the element we need rather than a fixed delay after 'load'
+  log('STEP5', 'Waiting for Saved Scans...');
+  await page.waitForSelector('text=Saved Scans', { timeout: 30000 });
+  log('STEP5', `Looking for scan: "${scanName}"`);
+
+  // A single XPath evaluation in the browser's native engine instead of
+  // running the :has-text matcher over every link and button.
+  const scanLocator = page.locator(
+    'xpath=//*[self::a or self::button][contains('
+      + `translate(normalize-space(.), '${UPPERCASE}', '${LOWERCASE}'), `
+      + `${xpathLiteral(scanName.toLowerCase())})]`,
+  ).first();
+  if ((await scanLocator.count()) === 0) {
+    await takeScreenshot(page, 'scan_not_found');
+    throw new Error(`Scan "${scanName}" not found`);
+  }
+
+  await scanLocator.click({ timeout: 30000 });
+  await page.waitForURL('**/scan/**', { timeout: 30000 });
+  log('STEP5', 'Scan opened');
+
+  // Step 6: Wait for results table
+  log('STEP6', 'Waiting for results table...');
+  await page.waitForSelector('table tr', { timeout: 30000 });
+  // table.rows is a live collection the parser maintains, so counting it
+  // skips re-running a selector query over the whole document.
+  const rowCount = await page.evaluate(() =>
+    Array.from(document.getElementsByTagName('table'))
+      .reduce((total, table) => total + table.rows.length, 0),
+  );
+  log('STEP6', `Results table loaded with ${rowCount} rows`);
+
+  // Step 7: Export CSV
+  log('STEP7', 'Clicking EXPORT...');
+  await page.click('button:has-text("EXPORT")');
+  await page.waitForSelector('text=All pages results to CSV', { timeout: 10000 });
+
+  const downloadPromise = page.waitForEvent('download', { timeout: 60000 });
+  await page.click('button:has-text("All pages results to CSV")');
+  const download = await downloadPromise;
+
+  // Read the export straight from the download stream rather than saving
+  // it to /tmp and reading it back.
+  const chunks: Buffer[] = [];
+  for await (const chunk of await download.createReadStream()) {
+    chunks.push(chunk as Buffer);
+  }
+  const csvContent = Buffer.concat(chunks).toString('utf-8');
+  log('STEP7', `CSV size: ${csvContent.length} bytes`);
+
+  const records: Record<ScanCsvField, string | undefined>[] = parse(csvContent, {
+    columns: (header: string[]) => {
+      log('STEP7', `CSV columns: ${header.join(', ')}`);
+      return resolveScanColumns(header);
+    },
+    skip_empty_lines: true,
+    trim: true,
+  });
+
+  log('STEP7', `Parsed ${records.length} records from CSV`);
+
+  // Transform to ScanResultRow (raw float values — portfolio service converts)
+  const results: ScanResultRow[] = records
+    .map((r) => {
+      const ticker = r.ticker || '';
+      if (!ticker) return null;
+
+      let expDate = '';
+      const rawExp = (r.expDate || '').split('/')[0];
+      if (rawExp) {
+        try {
+          expDate = parseExpirationDate(rawExp);
+        } catch (e: any) {
+          console.warn(`[Scraper] Could not parse expDate "${rawExp}": ${e.message}`);
+        }
+      }
+
+      // CSV percentage fields are decimals (0.8131 = 81.31%).
+      // portfolio.ts expects plain numbers (81.31) and divides by 100
+      // before converting to basis points, so multiply by 100 here.
+      const probRaw = parseFloat(r.probMaxProfit || '0');
+      const returnRaw = parseFloat(r.returnPercent || '0');
+      const ivRankRaw = parseFloat(r.ivRank || '0');
+      const ivPctRaw = parseFloat(r.ivPercentile || '0');
+      const moneynessRaw = parseFloat(r.moneyness || '0');
+
+      return {
+        ticker,
+        companyName: r.companyName || '',
+        price: parseFloat(r.price || '0'),
+        priceChange: parseFloat(r.priceChange || '0'),
+        ivRank: ivRankRaw <= 1 ? ivRankRaw * 100 : ivRankRaw,
+        ivPercentile: ivPctRaw <= 1 ? ivPctRaw * 100 : ivPctRaw,
+        strike: r.strike || '',
+        moneyness: moneynessRaw <= 1 ? moneynessRaw * 100 : moneynessRaw,
+        expDate,
+        daysToExp: parseInt(r.daysToExp || '0'),
+        totalOptVol: parseInt(r.totalOptVol || '0'),
+        probMaxProfit: probRaw <= 1 ? probRaw * 100 : probRaw,
+        // CSV values are per-share dollars — do NOT multiply by 100 here;
+        // portfolio.ts already handles per-share → per-contract conversion.
+        maxProfit: parseFloat(r.maxProfit || '0'),
+        maxLoss: parseFloat(r.maxLoss || '0'),
+        returnPercent: returnRaw <= 1 ? returnRaw * 100 : returnRaw,
+      } as ScanResultRow;
+    })
+    .filter((r): r is ScanResultRow => r !== null);
+
+  log('SUCCESS', `Downloaded ${results.length} scan results`);
+  return results;
+}
+
 // ---------------------------------------------------------------------------
 // scrapeOptionSamurai
 // ---------------------------------------------------------------------------
 
+/** Upper bound on scans exported concurrently within one login session. */
+const MAX_PARALLEL_SCANS = 4;
+
+/** Per-scan outcome of scrapeOptionSamuraiScans. */
+export interface ScanBatchResult {
+  /** Rows of each scan that was exported. */
+  results: Map<string, ScanResultRow[]>;
+  /** Error message of each scan that failed. */
+  failures: Map<string, string>;
+}
+
 /**
  * Scrape Option Samurai using Playwright (matching OptionScope pattern).
  *
@@ -87,6 +550,26 @@ export async function testLogin(): Promise<{ success: boolean; message: string }
 export async function scrapeOptionSamurai(
   scanName: string = 'bi-weekly income all',
 ): Promise<ScanResultRow[]> {
+  const { results, failures } = await scrapeOptionSamuraiScans([scanName]);
+  const failure = failures.get(scanName);
+  if (failure !== undefined) {
+    throw new Error(`Failed to download scan results: ${failure}`);
+  }
+  return results.get(scanName) ?? [];
+}
+
+/**
+ * Scrape several saved scans with a single login.
+ *
+ * Pages in one BrowserContext share the session cookies, so after logging
+ * in once, up to MAX_PARALLEL_SCANS pages export scans concurrently and
+ * overlap their network and render waits. A scan that fails is recorded in
+ * `failures` without stopping the others; only a failed login or session
+ * setup rejects the whole batch.
+ */
+export async function scrapeOptionSamuraiScans(
+  scanNames: string[],
+): Promise<ScanBatchResult> {
   const email = process.env.OPTION_SAMURAI_EMAIL;
   const password = process.env.OPTION_SAMURAI_PASSWORD;
 
@@ -94,200 +577,48 @@ export async function scrapeOptionSamurai(
     throw new Error('Missing OPTION_SAMURAI_EMAIL or OPTION_SAMURAI_PASSWORD');
   }
 
-  let browser: Browser | null = null;
+  let context: BrowserContext | null = null;
 
   try {
     log('INIT', 'Starting Option Samurai automation with Playwright...');
 
-    browser = await chromium.launch({
-      headless: true,
-      args: ['--no-sandbox', '--disable-setuid-sandbox'],
-    });
-
-    const context = await browser.newContext();
-    const page = await context.newPage();
-
-    page.on('console', msg => console.log(`[Browser] ${msg.text()}`));
-
-    // Step 1: Navigate to homepage
-    log('STEP1', 'Navigating to homepage...');
-    await page.goto('https://optionsamurai.com', { waitUntil: 'domcontentloaded', timeout: 60000 });
-
-    // Step 2: Click Login
-    log('STEP2', 'Looking for Login button...');
-    const loginSelectors = [
-      'a[href*="login"]',
-      'button:has-text("Login")',
-      'a:has-text("Login")',
-      'a:has-text("LOG IN")',
-      'button:has-text("LOG IN")',
-    ];
-
-    let loginClicked = false;
-    for (const sel of loginSelectors) {
-      if ((await page.locator(sel).count()) > 0) {
-        await page.click(sel);
-        loginClicked = true;
-        break;
-      }
-    }
-
-    if (!loginClicked) {
-      await takeScreenshot(page, 'login_button_not_found');
-      throw new Error('Login button not found');
-    }
-
-    await page.waitForURL('**/login**', { timeout: 30000 });
-    log('STEP2', 'On login page');
-
-    // Step 3: Fill credentials
-    log('STEP3', 'Filling credentials...');
-    await page.waitForSelector('input[type="email"], input[name="email"], input[placeholder*="email" i]', { timeout: 10000 });
-    await page.locator('input[type="email"], input[name="email"], input[placeholder*="email" i]').first().fill(email);
-    await page.locator('input[type="password"], input[name="password"]').first().fill(password);
-
-    // Step 4: Submit login
-    log('STEP4', 'Clicking LOG IN...');
-    const submitSelectors = [
-      'button:has-text("LOG IN")',
-      'button:has-text("Log In")',
-      'button[type="submit"]',
-      'input[type="submit"]',
-    ];
-
-    let submitClicked = false;
-    for (const sel of submitSelectors) {
-      if ((await page.locator(sel).count()) > 0) {
-        await page.click(sel);
-        submitClicked = true;
-        break;
+    const session = await openSession(email, password);
+    context = session.context;
+    const { page, screenerUrl } = session;
+
+    // Registered on the context so every worker page's logs are kept
+    context.on('console', msg => console.log(`[Browser] ${msg.text()}`));
+
+    const results = new Map<string, ScanResultRow[]>();
+    const failures = new Map<string, string>();
+    const queue = [...new Set(scanNames)];
+    const worker = async (workerPage: Page) => {
+      for (let name = queue.shift(); name !== undefined; name = queue.shift()) {
+        try {
+          results.set(name, await runScan(workerPage, name, screenerUrl));
+        } catch (error: any) {
+          console.error(`[Scraper] Scan "${name}" failed:`, error.message);
+          failures.set(name, error.message);
+        }
       }
-    }
-
-    if (!submitClicked) {
-      await takeScreenshot(page, 'submit_not_found');
-      throw new Error('Submit button not found');
-    }
-
-    await page.waitForURL('**/screener**', { timeout: 60000 });
-    log('STEP4', 'Logged in successfully');
-
-    // Step 5: Find and click the saved scan
-    log('STEP5', 'Waiting for Saved Scans...');
-    await page.waitForLoadState('load', { timeout: 30000 });
-    await page.waitForTimeout(2000);
-
-    await page.waitForSelector('text=Saved Scans', { timeout: 30000 });
-    log('STEP5', `Looking for scan: "${scanName}"`);
-
-    const scanLocator = page.locator(`a:has-text("${scanName}"), button:has-text("${scanName}")`).first();
-    const scanCount = await page.locator(`a:has-text("${scanName}"), button:has-text("${scanName}")`).count();
-
-    if (scanCount === 0) {
-      await takeScreenshot(page, 'scan_not_found');
-      throw new Error(`Scan "${scanName}" not found`);
-    }
-
-    await scanLocator.click({ timeout: 30000 });
-    await page.waitForURL('**/scan/**', { timeout: 30000 });
-    log('STEP5', 'Scan opened');
-
-    // Step 6: Wait for results table
-    log('STEP6', 'Waiting for results table...');
-    await page.waitForSelector('table tr', { timeout: 30000 });
-    const rowCount = await page.locator('table tr').count();
-    log('STEP6', `Results table loaded with ${rowCount} rows`);
-
-    // Step 7: Export CSV
-    log('STEP7', 'Clicking EXPORT...');
-    await page.click('button:has-text("EXPORT")');
-    await page.waitForSelector('text=All pages results to CSV', { timeout: 10000 });
-
-    const downloadPromise = page.waitForEvent('download', { timeout: 60000 });
-    await page.click('button:has-text("All pages results to CSV")');
-    const download = await downloadPromise;
-
-    const downloadPath = `/tmp/scan_${Date.now()}.csv`;
-    await download.saveAs(downloadPath);
-    log('STEP7', `CSV saved to ${downloadPath}`);
-
-    // Parse CSV
-    const fs = await import('fs');
-    const csvContent = fs.readFileSync(downloadPath, 'utf-8');
-    log('STEP7', `CSV size: ${csvContent.length} bytes`);
-
-    const records: any[] = parse(csvContent, {
-      columns: true,
-      skip_empty_lines: true,
-      trim: true,
-    });
-
-    log('STEP7', `Parsed ${records.length} records from CSV`);
+    };
 
-    if (records.length > 0) {
-      log('STEP7', `CSV columns: ${Object.keys(records[0]).join(', ')}`);
+    const pages = [page];
+    const workerCount = Math.min(queue.length, MAX_PARALLEL_SCANS);
+    for (let i = 1; i < workerCount; i++) {
+      pages.push(await context.newPage());
     }
+    await Promise.all(pages.map(worker));
 
-    // Transform to ScanResultRow (raw float values — portfolio service converts)
-    const results: ScanResultRow[] = records
-      .map((r: any) => {
-        const ticker = r['Underlying'] || r['Ticker'] || r['Symbol'] || '';
-        if (!ticker) return null;
-
-        let expDate = '';
-        const rawExp = (r['expDate'] || r['Expiration Di'] || r['Expiration Date'] || r['Exp. Date'] || r['Expiration'] || '').split('/')[0];
-        if (rawExp) {
-          try {
-            expDate = parseExpirationDate(rawExp);
-          } catch (e: any) {
-            console.warn(`[Scraper] Could not parse expDate "${rawExp}": ${e.message}`);
-          }
-        }
-
-        // CSV percentage fields are decimals (0.8131 = 81.31%).
-        // portfolio.ts expects plain numbers (81.31) and divides by 100
-        // before converting to basis points, so multiply by 100 here.
-        const probRaw = parseFloat(r['Prob Max Pro'] || r['Prob Max Profit'] || r['Prob. of Max. Profit'] || '0');
-        const returnRaw = parseFloat(r['Return Acqui'] || r['Return Acquisition'] || r['Return %'] || '0');
-        const ivRankRaw = parseFloat(r['Stock Iv'] || r['IV Rank'] || '0');
-        const ivPctRaw = parseFloat(r['IV Percentile'] || '0');
-        const moneynessRaw = parseFloat(r['Moneyness'] || '0');
-
-        return {
-          ticker,
-          companyName: r['Company Name'] || r['Name'] || '',
-          price: parseFloat(r['Stock Last'] || r['Price'] || '0'),
-          priceChange: parseFloat(r['Price Change'] || r['% Change'] || '0'),
-          ivRank: ivRankRaw <= 1 ? ivRankRaw * 100 : ivRankRaw,
-          ivPercentile: ivPctRaw <= 1 ? ivPctRaw * 100 : ivPctRaw,
-          strike: r['Strike'] || '',
-          moneyness: moneynessRaw <= 1 ? moneynessRaw * 100 : moneynessRaw,
-          expDate,
-          daysToExp: parseInt(r['Days To Exp'] || r['Days To Expiration'] || r['DTE'] || '0'),
-          totalOptVol: parseInt(r['Total Vol'] || r['Total Opt. Vol.'] || r['Volume'] || '0'),
-          probMaxProfit: probRaw <= 1 ? probRaw * 100 : probRaw,
-          // CSV values are per-share dollars — do NOT multiply by 100 here;
-          // portfolio.ts already handles per-share → per-contract conversion.
-          maxProfit: parseFloat(r['Max Profit'] || r['Max. Profit'] || '0'),
-          maxLoss: parseFloat(r['Max Loss'] || r['Max. Loss'] || '0'),
-          returnPercent: returnRaw <= 1 ? returnRaw * 100 : returnRaw,
-        } as ScanResultRow;
-      })
-      .filter((r): r is ScanResultRow => r !== null);
-
-    // Clean up
-    fs.unlinkSync(downloadPath);
-
-    log('SUCCESS', `Downloaded ${results.length} scan results`);
-    return results;
+    return { results, failures };
 
   } catch (error: any) {
     console.error('[Scraper] Automation failed:', error.message);
     throw new Error(`Failed to download scan results: ${error.message}`);
   } finally {
-    if (browser) {
-      await browser.close();
-      log('CLEANUP', 'Browser closed');
+    if (context) {
+      await context.close();
+      log('CLEANUP', 'Browser context closed');
     }
   }
 }
@@ -2,7 +2,7 @@
 
 import math
 import pytest
-from option_strategy.pricing import BlackScholes
+from option_strategy.pricing import BlackScholes, OptType
 
 
 def test_call_price_atm():
@@ -106,3 +106,53 @@ def test_invalid_option_type():
     bs = BlackScholes(spot=100, strike=100, expiry_days=30, volatility=0.25, rate=0.05)
     with pytest.raises(ValueError):
         bs.price("invalid")
+
+
+def test_vectorized_matches_scalar():
+    """Vectorized pricing should agree with the scalar model per strike."""
+    strikes = [90, 100, 110]
+    calls, puts, _, _ = BlackScholes.vectorized(100, strikes, 30, 0.25, 0.05)
+    for i, k in enumerate(strikes):
+        bs = BlackScholes(spot=100, strike=k, expiry_days=30, volatility=0.25, rate=0.05)
+        assert abs(calls[i] - bs.call_price()) < 1e-10
+        assert abs(puts[i] - bs.put_price()) < 1e-10
+
+
+def test_inputs_are_read_only():
+    """Inputs cannot be reassigned once the cached terms are computed."""
+    bs = BlackScholes(spot=100, strike=100, expiry_days=30, volatility=0.25, rate=0.05)
+    with pytest.raises(AttributeError):
+        bs.spot = 105
+
+
+def test_batch_matches_scalar():
+    """Batch pricing should agree with the scalar model for every row."""
+    spots = [100, 150, 50, 110]
+    strikes = [100, 100, 100, 100]
+    expiries = [30, 45, 10, 0]
+    out = BlackScholes.batch(spots, strikes, expiries, 0.25, 0.05)
+    for i in range(len(spots)):
+        bs = BlackScholes(spot=spots[i], strike=strikes[i], expiry_days=expiries[i],
+                          volatility=0.25, rate=0.05)
+        for opt in ("call", "put"):
+            s = bs.summary(opt)
+            assert abs(out[opt][i] - s["price"]) < 1e-9
+            for greek in ("delta", "theta", "rho"):
+                assert abs(out[f"{opt}_{greek}"][i] - s[greek]) < 1e-9
+        assert abs(out["gamma"][i] - bs.gamma()) < 1e-9
+        assert abs(out["vega"][i] - bs.vega()) < 1e-9
+
+
+def test_opt_type_matches_string():
+    """OptType members should give the same results as 'call'/'put'."""
+    bs = BlackScholes(spot=100, strike=105, expiry_days=45, volatility=0.30, rate=0.05)
+    assert bs.summary(OptType.CALL) == bs.summary("call")
+    assert bs.summary(OptType.PUT) == bs.summary("put")
+
+
+def test_numeric_option_type_rejected():
+    """Ints, floats and bools equal to an OptType are not option types."""
+    bs = BlackScholes(spot=100, strike=105, expiry_days=45, volatility=0.30, rate=0.05)
+    for bad in (1, 1.0, True, -1, ["call"]):
+        with pytest.raises(ValueError):
+            bs.price(bad)
@@ -1,5 +1,9 @@
 """Tests for the strategy builder and P&L analysis."""
 
+import dataclasses
+import json
+
+import numpy as np
 import pytest
 from option_strategy.strategy import (
     OptionLeg, Strategy,
@@ -13,6 +17,13 @@ def test_option_leg_invalid_type():
         OptionLeg("future", 100, "long", 5.0)
 
 
+def test_option_leg_unhashable_type_and_position():
+    with pytest.raises(ValueError):
+        OptionLeg(["call"], 100, "long", 5.0)
+    with pytest.raises(ValueError):
+        OptionLeg("call", 100, ["long"], 5.0)
+
+
 def test_option_leg_invalid_position():
     with pytest.raises(ValueError):
         OptionLeg("call", 100, "neutral", 5.0)
@@ -42,6 +53,15 @@ def test_long_put_payoff():
     assert leg.payoff_at_expiry(110) == -4.0
 
 
+def test_option_leg_is_immutable():
+    leg = OptionLeg("call", 100, "long", 5.0)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        leg.option_type = "put"
+    put = dataclasses.replace(leg, option_type="put")
+    assert put.payoff_at_expiry(90) == 5.0
+    assert leg.payoff_at_expiry(90) == -5.0
+
+
 def test_strategy_net_premium():
     s = Strategy("Test")
     s.add_leg(OptionLeg("call", 95, "long", 8.0))   # pay 8
@@ -106,3 +126,136 @@ def test_pnl_result_str():
     assert "Max Profit" in text
     assert "Max Loss" in text
     assert "Breakevens" in text
+
+
+def test_breakeven_on_grid_point():
+    # Spots step by 1.0, so the 105 breakeven lands exactly on the grid
+    s = long_call(100, 100, 5.0)
+    pnl = s.pnl_at_expiry(spot_range=(90, 110), num_points=21)
+    assert pnl.breakevens.tolist() == [105.0]
+
+
+def test_breakevens_independent_of_resolution():
+    # Breakevens come from the strikes, so a coarse sweep finds them too
+    s = iron_condor(100, 85, 90, 110, 115, 0.5, 2.0, 2.0, 0.5)
+    pnl = s.pnl_at_expiry(spot_range=(70, 140), num_points=5)
+    assert pnl.breakevens.tolist() == [87.0, 113.0]
+
+
+def test_pnl_batch_matches_individual():
+    strategies = [
+        long_call(100, 105, 3.0),
+        straddle(100, 100, 5.0, 5.0),
+        iron_condor(100, 85, 90, 110, 115, 0.5, 2.0, 2.0, 0.5),
+    ]
+    spots = np.linspace(70, 140, 50)
+    batch = Strategy.pnl_batch(strategies, spots)
+    assert batch.shape == (3, 50)
+    for row, s in zip(batch, strategies):
+        expected = sum(leg.payoff_array(spots) for leg in s.legs)
+        assert np.allclose(row, expected)
+
+
+def test_pnl_float32_matches_float64():
+    s = iron_condor(100, 85, 90, 110, 115, 0.5, 2.0, 2.0, 0.5)
+    pnl64 = s.pnl_at_expiry(spot_range=(70, 140))
+    pnl32 = s.pnl_at_expiry(spot_range=(70, 140), dtype=np.float32)
+    assert pnl32.pnl.dtype == np.float32
+    assert np.max(np.abs(pnl32.pnl - pnl64.pnl)) < 1e-3
+    assert abs(pnl32.max_profit - pnl64.max_profit) < 1e-3
+    assert np.array_equal(pnl32.breakevens, pnl64.breakevens)
+
+
+def test_presets_return_independent_strategies():
+    s = long_call(100, 105, 3.0)
+    assert s == Strategy("Long Call", [OptionLeg("call", 105, "long", 3.0)])
+    s.add_leg(OptionLeg("put", 95, "long", 2.0))
+    assert len(s.legs) == 2
+    fresh = long_call(100, 105, 3.0)
+    assert fresh is not s
+    assert len(fresh.legs) == 1
+    assert fresh.net_premium == 3.0
+
+
+def test_pnl_stats_only_matches_sweep():
+    for s in (long_call(100, 105, 3.0), long_put(100, 95, 2.0),
+              iron_condor(100, 85, 90, 110, 115, 0.5, 2.0, 2.0, 0.5)):
+        full = s.pnl_at_expiry(spot_range=(70, 140))
+        stats = s.pnl_at_expiry(spot_range=(70, 140), num_points=0)
+        assert abs(stats.max_profit - full.max_profit) < 1e-9
+        assert abs(stats.max_loss - full.max_loss) < 1e-9
+        assert np.array_equal(stats.breakevens, full.breakevens)
+        assert np.allclose(np.interp(full.spots, stats.spots, stats.pnl),
+                           full.pnl)
+
+
+def test_c_kernel_matches_numpy():
+    try:
+        from option_strategy import _ckernel as ckernel
+    except ImportError:
+        pytest.skip("C kernel not built")
+    from option_strategy.strategy import _pnl_numpy
+    s = iron_condor(100, 85, 90, 110, 115, 0.5, 2.0, 2.0, 0.5)
+    spots = np.linspace(70, 140, 503)  # not a multiple of the SIMD width
+    expected, actual = np.empty_like(spots), np.empty_like(spots)
+    _pnl_numpy(spots, *s._as_arrays(), expected)
+    mx, mn = ckernel.pnl_kernel(spots, *s._as_arrays(), actual)
+    assert np.allclose(actual, expected)
+    assert np.isclose(mx, expected.max()) and np.isclose(mn, expected.min())
+
+
+def test_strategy_str_updates_after_add_leg():
+    s = Strategy("Test")
+    s.add_leg(OptionLeg("call", 95, "long", 8.0))
+    assert "Leg 2" not in str(s)
+    s.add_leg(OptionLeg("call", 110, "short", 2.0))
+    assert "Leg 2" in str(s)
+    assert "Net Premium: 6.00" in str(s)
+
+
+def test_breakevens_with_reversed_range():
+    s = Strategy("Test")
+    s.add_leg(OptionLeg("call", 100, "long", 5.0))
+    assert s.pnl_at_expiry(spot_range=(130, 80)).breakevens.tolist() == [105.0]
+    pnl = straddle(100, 100, 5.0, 5.0).pnl_at_expiry(spot_range=(130, 80))
+    assert pnl.breakevens.tolist() == [90.0, 110.0]
+
+
+def test_pnl_stats_only_with_reversed_range():
+    pnl = straddle(100, 100, 5.0, 5.0).pnl_at_expiry(
+        spot_range=(130, 80), num_points=0)
+    assert pnl.max_loss == -10.0
+    assert pnl.breakevens.tolist() == [90.0, 110.0]
+    single = long_call(100, 100, 5.0).pnl_at_expiry(
+        spot_range=(130, 80), num_points=0)
+    assert single.breakevens.tolist() == [105.0]
+    assert single.max_loss == -5.0 and single.max_profit == 25.0
+
+
+def test_large_sweep_does_not_grow_scratch():
+    from option_strategy import strategy
+    s = iron_condor(100, 85, 90, 110, 115, 0.5, 2.0, 2.0, 0.5)
+    small = s.pnl_at_expiry(spot_range=(70, 140), num_points=101)
+    big = s.pnl_at_expiry(spot_range=(70, 140), num_points=100_001)
+    assert np.allclose(big.pnl[::1000], small.pnl)
+    bufs = getattr(strategy._scratch, "bufs", {})
+    assert all(buf.size <= strategy._SCRATCH_MAX for buf in bufs.values())
+
+
+def test_strategy_asdict_excludes_caches():
+    s = long_call(100, 105, 3.0)
+    s.pnl_at_expiry()
+    assert s.net_premium == 3.0
+    str(s)
+    assert set(dataclasses.asdict(s)) == {"name", "legs"}
+    json.dumps(dataclasses.asdict(s))
+    pnl = s.pnl_at_expiry()
+    str(pnl)
+    assert "_str_cache" not in dataclasses.asdict(pnl)
+
+
+def test_strategy_str_follows_rename():
+    s = long_call(100, 105, 3.0)
+    assert "Long Call" in str(s)
+    s.name = "Renamed"
+    assert str(s).startswith("Strategy: Renamed")